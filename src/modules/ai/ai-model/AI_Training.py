@@ -7,21 +7,29 @@ import warnings
 import sys
 import os
 import json
+import hashlib
+import tempfile
+import types
+import joblib
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.svm import SVR
-from sklearn.model_selection import GridSearchCV
-from sklearn.metrics import mean_absolute_error, mean_squared_error
+from sklearn.svm import SVR, LinearSVR
+from sklearn.kernel_approximation import Nystroem
+from sklearn.pipeline import Pipeline
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV
+from scipy.stats import loguniform
+import tensorflow as tf
+from tensorflow.keras import mixed_precision
 from tensorflow.keras.optimizers import Adam
-from tensorflow.keras.models import Sequential
+from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
 from tensorflow.keras.regularizers import l2
-import matplotlib.pyplot as plt
-import matplotlib
-# Use non-interactive backend for server environments (no GUI)
-matplotlib.use('Agg')
+
+# Plots are written next to this script, where the backend picks them up
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # 🔧 Fix Unicode encoding for Windows console
 if sys.platform == 'win32':
@@ -66,12 +74,151 @@ warnings.filterwarnings('ignore')
 # -----------------------------
 
 def create_sequences_with_stride(X_scaled, y_scaled, seq_len, stride=1):
-    """Create overlapping sequences for data augmentation"""
-    X_seq, y_seq = [], []
-    for i in range(seq_len, len(y_scaled), stride):
-        X_seq.append(X_scaled[i-seq_len:i])
-        y_seq.append(y_scaled[i])
-    return np.array(X_seq), np.array(y_seq)
+    """Create overlapping sequences for data augmentation.
+
+    Windows are returned as a strided (read-only) view over X_scaled, so no
+    per-window copy is made; X_seq[i] == X_scaled[i*stride:i*stride+seq_len].
+    """
+    if len(y_scaled) <= seq_len:
+        return (np.empty((0, seq_len, X_scaled.shape[1]), dtype=X_scaled.dtype),
+                np.empty((0,) + y_scaled.shape[1:], dtype=y_scaled.dtype))
+    # (n_windows, 1, seq_len, n_feat) -> drop the last window, which has no
+    # target after it, and the singleton feature-window axis
+    windows = sliding_window_view(
+        X_scaled, (seq_len, X_scaled.shape[1]))[:-1, 0]
+    return windows[::stride], y_scaled[seq_len::stride]
+
+
+class FastMinMaxScaler:
+    """Minimal stand-in for sklearn's MinMaxScaler with feature_range=(0, 1).
+
+    Exposes the fitted data_min_, scale_ and min_ attributes. transform()
+    computes in float64 and writes its output directly in the requested
+    dtype, so the float32 cast for Keras needs no extra copy.
+    """
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = dtype
+
+    def fit(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        self.data_min_ = np.nanmin(X, axis=0)
+        data_range = np.nanmax(X, axis=0) - self.data_min_
+        # Constant columns map to 0 instead of dividing by zero (as sklearn)
+        data_range[data_range == 0.0] = 1.0
+        self.scale_ = 1.0 / data_range
+        self.min_ = -self.data_min_ * self.scale_
+        return self
+
+    def transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        out = np.empty(X.shape, dtype=self.dtype)
+        # x * scale and + min nearly cancel when values are large relative
+        # to their range, so keep both in float64 and only round on the
+        # final write into out
+        np.add(X * self.scale_, self.min_, out=out, casting='same_kind')
+        return out
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
+
+
+def format_svr_params(model):
+    """Format C/gamma/epsilon of an SVR or a Nystroem+LinearSVR pipeline"""
+    if isinstance(model, Pipeline):
+        gamma, svr = model.named_steps['nys'].gamma, model.named_steps['svr']
+    else:
+        gamma, svr = model.gamma, model
+    # Format gamma safely (it might be 'scale' or a float)
+    gamma_str = f"{gamma:.3f}" if isinstance(
+        gamma, (int, float)) else str(gamma)
+    return f"C={svr.C:.3f}, gamma={gamma_str}, epsilon={svr.epsilon:.3f}"
+
+
+def make_rbf_svr_predictor(svr, X_fit):
+    """Return a single-sample predict(x) for an RBF SVR fitted on X_fit.
+
+    Evaluates sum_i dual_i * exp(-gamma * ||sv_i - x||²) + b with one matvec
+    over precomputed support vectors, skipping sklearn's per-call input
+    validation. Used by the autoregressive forecast loop. Falls back to
+    svr.predict if the result does not match it on the first row of X_fit.
+    """
+    sv = svr.support_vectors_
+    dual = svr.dual_coef_.ravel()
+    sv_sq = np.einsum('ij,ij->i', sv, sv)
+    # Resolve gamma='scale'/'auto' the way SVR.fit does, from public state
+    if svr.gamma == 'scale':
+        X_var = X_fit.var()
+        gamma = 1.0 / (X_fit.shape[1] * X_var) if X_var != 0 else 1.0
+    elif svr.gamma == 'auto':
+        gamma = 1.0 / X_fit.shape[1]
+    else:
+        gamma = float(svr.gamma)
+    intercept = svr.intercept_[0]
+
+    def predict(x):
+        x = x.ravel()
+        sq_dist = sv_sq - 2.0 * (sv @ x) + x @ x
+        return np.exp(-gamma * sq_dist) @ dual + intercept
+
+    if not np.isclose(predict(X_fit[0]), svr.predict(X_fit[:1])[0]):
+        print("   ⚠️  Direct RBF kernel does not match svr.predict, using it instead")
+        return lambda x: svr.predict(x.reshape(1, -1))[0]
+    return predict
+
+
+def regression_metrics(y_true, y_pred):
+    """Return (MAE, RMSE, MAPE %, R²), computing the residuals only once"""
+    resid = y_true - y_pred
+    abs_resid = np.abs(resid)
+    ss_res = resid @ resid
+    centered = y_true - y_true.mean()
+    mae = abs_resid.mean()
+    rmse = np.sqrt(ss_res / len(resid))
+    mape = np.mean(abs_resid / np.abs(y_true + 1e-8)) * 100
+    r2 = 1 - ss_res / (centered @ centered)
+    return mae, rmse, mape, r2
+
+
+def unscale(values, data_min, data_range):
+    """Flat float64 values * data_range + data_min, in a single output buffer"""
+    out = np.multiply(np.ravel(values), data_range, dtype=np.float64)
+    out += data_min
+    return out
+
+
+def model_cache_key(csv_path, config):
+    """sha256 over the CSV bytes and the training config string"""
+    sha = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    sha.update(config.encode('utf-8'))
+    return sha.hexdigest()
+
+
+def save_atomically(path, write):
+    """Call write(tmp_path) on a temp file next to path, then os.replace() it.
+
+    Concurrent runs or a crash mid-write never leave a truncated cache file
+    behind. A failed write only prints a warning, the cache is best-effort.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix='.tmp-',
+        suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates the file 0600; give it the mode a normal open()
+        # would so a cache dir shared between users stays readable
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"   ⚠️  Could not write model cache {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 # -----------------------------
@@ -88,8 +235,15 @@ if not os.path.exists(csv_file_path):
     print(f"❌ ERROR: CSV file not found at: {csv_file_path}")
     sys.exit(1)
 
+# Verbose data dumps (head rows, unique scans, intermediate shapes) are only
+# useful when debugging a dataset, so print them only with AI_TRAIN_DEBUG=1
+DEBUG = os.getenv('AI_TRAIN_DEBUG') == '1'
+
 df = pd.read_csv(
     csv_file_path,
+    engine='c',
+    # Parsed at the header's full width on purpose: with usecols the C
+    # parser no longer skips rows that have too many fields
     on_bad_lines='skip',
     # Properly handle quoted fields with commas
     quotechar='"',
@@ -100,13 +254,22 @@ df = pd.read_csv(
 # 🔍 DEBUG: Print actual columns found
 print(f"📂 Loaded dataset: {df.shape[0]} rows, {df.shape[1]} columns")
 print(f"🔎 Columns found: {df.columns.tolist()}")
-print(f"🔍 First 3 rows of entire dataframe:")
-print(df.head(3).to_string())
+if DEBUG:
+    print(f"🔍 First 3 rows of entire dataframe:")
+    print(df.head(3).to_string())
 
 # 🧹 CLEANUP: Strip spaces from column names automatically
 df.columns = df.columns.str.strip()
 print(f"🔍 After stripping spaces, columns: {df.columns.tolist()}")
 
+# ⚡ Only the target and requested feature columns are used downstream, so
+# project to them right after parsing; the cleanup passes below then only
+# copy those. An unknown target keeps every column for the diagnostics.
+wanted_columns = {os.getenv('TARGET_COLUMN')} | {
+    c.strip() for c in os.getenv('FEATURE_COLUMNS', '').split(',')}
+if os.getenv('TARGET_COLUMN') in df.columns:
+    df = df[[c for c in df.columns if c in wanted_columns]]
+
 # -----------------------------
 # 2️⃣ User selections (from environment variables)
 # -----------------------------
@@ -119,19 +282,20 @@ if not target_column:
 print(f"📋 Using target column from environment: '{target_column}'")
 
 # 🔍 DEBUG: Check target column AFTER it's defined
-print(f"\n🔍 DEBUG: Checking target column '{target_column}':")
-if target_column in df.columns:
+if DEBUG and target_column in df.columns:
+    print(f"\n🔍 DEBUG: Checking target column '{target_column}':")
     print(f"   ✅ Target column exists")
     print(f"   Data type: {df[target_column].dtype}")
     print(f"   First 10 values: {df[target_column].head(10).tolist()}")
     print(
         f"   Unique values (first 20): {df[target_column].unique()[:20].tolist()}")
-else:
+elif target_column not in df.columns:
+    print(f"\n🔍 DEBUG: Checking target column '{target_column}':")
     print(f"   ❌ Target column NOT FOUND!")
     print(f"   Available columns: {df.columns.tolist()}")
     # Try to find a column that looks like it might be the target
-    numeric_cols = [
-        c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    numeric_cols = df.select_dtypes(
+        include=[np.number, 'bool']).columns.tolist()
     print(f"   Numeric columns found: {numeric_cols}")
     if len(numeric_cols) > 0:
         print(f"   💡 Suggestion: Use '{numeric_cols[0]}' as target column")
@@ -162,6 +326,21 @@ except Exception as e:
     print(f"FORECAST_WINDOW='{forecast_window_raw}', details: {e}")
     sys.exit(1)
 
+# The backend only consumes forecast_plot.png; the training-history and
+# train/test diagnostic figures are local debugging aids, so skip them
+# unless GENERATE_PLOTS=1
+GENERATE_PLOTS = os.getenv('GENERATE_PLOTS') == '1'
+# forecast_plot.png is what the backend publishes, so it stays on by
+# default; headless retraining runs can skip it with FORECAST_PLOT=0
+FORECAST_PLOT = os.getenv('FORECAST_PLOT', '1') != '0'
+
+# ⚡ matplotlib is only imported when some figure will actually be drawn
+if GENERATE_PLOTS or FORECAST_PLOT:
+    import matplotlib
+    # Use non-interactive backend for server environments (no GUI)
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
 # Validate that target column exists in the dataset
 if target_column not in df.columns:
     print(f"❌ ERROR: Target column '{target_column}' not found in dataset")
@@ -184,12 +363,20 @@ elif original_feature_count > len(feature_columns):
 print(
     f"   Using {len(feature_columns)} feature columns (original list size: {original_feature_count})")
 
-# Drop rows with NaN in target column
-df = df.dropna(subset=[target_column]).reset_index(drop=True)
-print(f"   Rows after removing NaN from target: {len(df)}")
+# 🧹 CLEANUP: Force target to be numeric (handles '?0.2' typos)
+if DEBUG:
+    print(
+        f"   🔍 Debug: Target column sample values: {df[target_column].head().tolist()}")
+df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
+
+# Drop rows whose target is missing or not a number with a single mask
+# (no positional index is used downstream, so no reset_index copy either)
+df = df[df[target_column].notna()]
+print(f"   Rows after removing NaN/non-numeric target: {len(df)}")
 
 if len(df) == 0:
     print("❌ ERROR: All rows removed after dropping NaN in target column")
+    print("   The target column values cannot be converted to numbers")
     sys.exit(1)
 
 # -----------------------------
@@ -209,24 +396,12 @@ if model_type not in ["SVR", "LSTM"]:
 
 print(f"\n🤖 Using model type from environment: {model_type}")
 
-# 🧹 CLEANUP: Force target to be numeric (handles '?0.2' typos)
-print(f"   🔍 Debug: Before numeric conversion, df shape: {df.shape}")
-print(
-    f"   🔍 Debug: Target column sample values: {df[target_column].head().tolist()}")
-df[target_column] = pd.to_numeric(df[target_column], errors='coerce')
-print(
-    f"   🔍 Debug: After numeric conversion, NaN count in target: {df[target_column].isna().sum()}")
-df = df.dropna(subset=[target_column])
-print(f"   🔍 Debug: After dropna on target, df shape: {df.shape}")
-
-if len(df) == 0:
-    print("❌ ERROR: All rows removed after converting target to numeric")
-    print("   The target column values cannot be converted to numbers")
-    sys.exit(1)
-
 # Handle missing values broadly first to fix broken numeric cols
-df = df.fillna(method='ffill').fillna(method='bfill')
-print(f"   🔍 Debug: After ffill/bfill, df shape: {df.shape}")
+# (df only holds the target/feature columns, see the projection above)
+df.ffill(inplace=True)
+df.bfill(inplace=True)
+if DEBUG:
+    print(f"   🔍 Debug: After ffill/bfill, df shape: {df.shape}")
 
 # 🔧 Robustify target a bit: clip extreme outliers so that a few very
 # large values do not dominate the loss and R², which is especially
@@ -254,10 +429,12 @@ if len(feature_columns) == 0:
     feature_columns = [target_column]
 
 # Validate that all feature columns are numeric
-numeric_features = [
-    c for c in feature_columns if pd.api.types.is_numeric_dtype(df[c])]
+# (one dtype scan instead of a per-column is_numeric_dtype check per list;
+# bool is included to match is_numeric_dtype)
+numeric_cols_set = set(df.select_dtypes(include=[np.number, 'bool']).columns)
+numeric_features = [c for c in feature_columns if c in numeric_cols_set]
 non_numeric_features = [
-    c for c in feature_columns if not pd.api.types.is_numeric_dtype(df[c])]
+    c for c in feature_columns if c not in numeric_cols_set]
 
 if non_numeric_features:
     print(
@@ -265,17 +442,19 @@ if non_numeric_features:
     print("   Only numeric columns are allowed for features and target")
     sys.exit(1)
 
-# Handle specific missing values if any remain
-for c in numeric_features:
-    df[c] = df[c].fillna(df[c].median())
+# Handle specific missing values if any remain (all medians in one pass)
+if numeric_features:
+    df[numeric_features] = df[numeric_features].fillna(
+        df[numeric_features].median())
 
 # All features are numeric, so no encoding needed
 X_numeric = df[numeric_features] if numeric_features else pd.DataFrame()
 df_encoded = pd.DataFrame()  # No categorical features to encode
 
-print(f"   🔍 Debug: df shape before X creation: {df.shape}")
-print(f"   🔍 Debug: numeric_features count: {len(numeric_features)}")
-print(f"   🔍 Debug: X_numeric shape: {X_numeric.shape}")
+if DEBUG:
+    print(f"   🔍 Debug: df shape before X creation: {df.shape}")
+    print(f"   🔍 Debug: numeric_features count: {len(numeric_features)}")
+    print(f"   🔍 Debug: X_numeric shape: {X_numeric.shape}")
 
 # Create X matrix - handle empty DataFrames properly
 if X_numeric.empty and df_encoded.empty:
@@ -291,7 +470,8 @@ elif df_encoded.empty:
 else:
     X = pd.concat([X_numeric, df_encoded], axis=1)
 
-print(f"   🔍 Debug: Final X shape: {X.shape}")
+if DEBUG:
+    print(f"   🔍 Debug: Final X shape: {X.shape}")
 
 # Remember index of target column inside feature matrix (if present).
 # This is later used to update the autoregressive target value during
@@ -340,11 +520,26 @@ if len(y) == 0 or np.isnan(y).all():
 print(f"✅ Final dataset shape: {X.shape[0]} rows, {X.shape[1]} features")
 
 # Scale features
-scaler_X = MinMaxScaler()
-scaler_y = MinMaxScaler()
+# Keras computes in float32 anyway, so halve the bytes of every sequence
+# copy and batch up front. libsvm only works in float64, so the SVR path
+# keeps float64 instead of converting back on each fit.
+scaled_dtype = np.float32 if model_type == "LSTM" else np.float64
+scaler_X = FastMinMaxScaler(dtype=scaled_dtype)
+scaler_y = FastMinMaxScaler(dtype=scaled_dtype)
 X_scaled = scaler_X.fit_transform(X)
 y_scaled = scaler_y.fit_transform(y)
 
+# Tensor-core kernels in cuDNN are only picked when the inner dimensions
+# are multiples of 8, so on the mixed-precision GPU path pad the feature
+# width with constant zero columns (appended, so feature indices are kept).
+has_gpu = bool(tf.config.list_physical_devices('GPU'))
+use_mixed_precision = model_type == "LSTM" and has_gpu
+if use_mixed_precision:
+    feature_pad = (-X_scaled.shape[1]) % 8
+    if feature_pad:
+        X_scaled = np.pad(X_scaled, ((0, 0), (0, feature_pad)))
+        print(f"   ⚡ Padded feature width with {feature_pad} zero columns")
+
 # -----------------------------
 # 4️⃣ Create sequences with adaptive augmentation
 # -----------------------------
@@ -352,7 +547,7 @@ y_scaled = scaler_y.fit_transform(y)
 # SEQ_LEN = min(30, len(y_scaled) // 5)
 # print(f"\n📏 Using sequence length: {SEQ_LEN}")
 
-SEQ_LEN = 40
+SEQ_LEN = 40  # keep a multiple of 8 (tensor-core friendly)
 
 initial_samples = len(y_scaled) - SEQ_LEN
 
@@ -389,7 +584,10 @@ print(f"Final shape → X_seq: {X_seq.shape}, y_seq: {y_seq.shape}")
 # 5️⃣ Train/test split
 # -----------------------------
 split_idx = int(0.8*len(X_seq))
-X_train_seq, X_test_seq = X_seq[:split_idx], X_seq[split_idx:]
+# X_seq is a strided view; materialize each split once so the flatten for
+# SVR and the tensor conversion for LSTM don't each copy it again
+X_train_seq = np.ascontiguousarray(X_seq[:split_idx])
+X_test_seq = np.ascontiguousarray(X_seq[split_idx:])
 y_train_seq, y_test_seq = y_seq[:split_idx], y_seq[split_idx:]
 
 # -----------------------------
@@ -401,6 +599,20 @@ print(f"\n📊 Actual Training Samples: {n_samples}")
 print(f"🤖 Confirmed Model: {model_type}")
 
 
+# ⚡ Optional trained-model cache: with MODEL_CACHE_DIR set, a rerun on the
+# same CSV bytes and the same target/features/model reuses the fitted model
+# instead of training again.
+model_cache_dir = os.getenv('MODEL_CACHE_DIR')
+model_cache_base = None
+if model_cache_dir:
+    os.makedirs(model_cache_dir, exist_ok=True)
+    # The input width includes the GPU-only tensor-core padding and the
+    # precision policy differs per host, so both are part of the key
+    cache_config = (f"{target_column}|{','.join(feature_columns)}|{model_type}"
+                    f"|{SEQ_LEN}|{X_scaled.shape[1]}|{use_mixed_precision}")
+    model_cache_base = os.path.join(
+        model_cache_dir, model_cache_key(csv_file_path, cache_config))
+
 # -----------------------------
 # 7️⃣ Train model
 # -----------------------------
@@ -408,45 +620,93 @@ if model_type == "SVR":
     X_train_flat = X_train_seq.reshape(X_train_seq.shape[0], -1)
     X_test_flat = X_test_seq.reshape(X_test_seq.shape[0], -1)
 
-    print("   🔍 Grid searching for optimal SVR parameters...")
+    print("   🔍 Searching for optimal SVR parameters...")
 
-    # Grid search for best hyperparameters
-    param_grid = {
-        'C': [1, 10, 20],
-        'gamma': [0.01, 0.1],
-        'epsilon': [0.01, 0.1]
+    # Random search over a wider log-scale space: the number of fits is set
+    # by n_candidates instead of growing with every value added to a grid
+    param_distributions = {
+        'C': loguniform(0.1, 100),
+        'gamma': loguniform(1e-3, 1),
+        # The target is scaled to [0, 1], so a tube wider than ~0.2 covers
+        # most of its range and fits a flat model; don't spend budget there
+        'epsilon': loguniform(1e-3, 0.2)
     }
 
-    svr_base = SVR(kernel="rbf")
-    # Calculate CV folds - must be at least 2 for GridSearchCV
+    # Exact RBF SVR costs O(n²) memory and time in the number of training
+    # windows. Past this size, approximate the same kernel with a Nystroem
+    # feature map and fit a linear SVR on it, which scales as O(n·k).
+    NYSTROEM_MIN_SAMPLES = 10000
+    SVR_CACHE_MB = 1024
+    use_nystroem = len(X_train_flat) > NYSTROEM_MIN_SAMPLES
+
+    if use_nystroem:
+        print(
+            f"   ⚡ Large training set ({len(X_train_flat)} samples): using Nystroem-approximated RBF + LinearSVR")
+        svr_base = Pipeline([
+            ('nys', Nystroem(kernel='rbf', n_components=256, random_state=0)),
+            # With n >> n_components the primal solver is far faster than
+            # the dual; it needs the squared epsilon-insensitive loss
+            ('svr', LinearSVR(loss='squared_epsilon_insensitive', dual=False))
+        ])
+        param_distributions = {
+            'svr__C': param_distributions['C'],
+            'nys__gamma': param_distributions['gamma'],
+            'svr__epsilon': param_distributions['epsilon']
+        }
+    else:
+        # Larger libsvm kernel cache (MB) so fewer kernel rows are recomputed
+        svr_base = SVR(kernel="rbf", cache_size=SVR_CACHE_MB, shrinking=True)
+    # Calculate CV folds - must be at least 2 for the CV search
     # Use at least 2 folds, but don't exceed 3 or train_size/10
     cv_folds = max(2, min(3, len(X_train_flat) // 10))
 
+    svr_cache_path = model_cache_base and model_cache_base + '.joblib'
+
+    svr_model = None
+    if svr_cache_path and os.path.exists(svr_cache_path):
+        try:
+            svr_model = joblib.load(svr_cache_path)
+            print(
+                f"   ⚡ Loaded cached SVR model: {format_svr_params(svr_model)}")
+        except Exception as e:
+            print(f"   ⚠️  Unreadable cached SVR model, retraining: {e}")
+    svr_from_cache = svr_model is not None
+
     # If we have very few samples, skip grid search and use default parameters
-    if len(X_train_flat) < 20:
+    if not svr_from_cache and len(X_train_flat) < 20:
         print(
             f"   ⚠️  Very few training samples ({len(X_train_flat)}), using default SVR parameters")
-        svr_model = SVR(kernel='rbf', C=1.0, gamma='scale', epsilon=0.1)
+        svr_model = SVR(kernel='rbf', C=1.0, gamma='scale', epsilon=0.1,
+                        cache_size=SVR_CACHE_MB, shrinking=True)
         svr_model.fit(X_train_flat, y_train_seq.ravel())
         print("   ✓ Using default SVR parameters (no grid search)")
-    else:
-        grid_search = GridSearchCV(
+    elif not svr_from_cache:
+        # Successive halving: score every candidate on a subsample first and
+        # only refit the best third on 3x more rows, instead of running
+        # every candidate on the full training set
+        grid_search = HalvingRandomSearchCV(
             svr_base,
-            param_grid,
+            param_distributions,
+            n_candidates=20,
+            factor=3,
+            resource='n_samples',
+            min_resources=min(len(X_train_flat),
+                              max(50, len(X_train_flat) // 5)),
             cv=cv_folds,
             scoring='neg_mean_squared_error',
             n_jobs=-1,
+            random_state=42,  # deterministic subsamples between runs
             verbose=3
         )
 
         grid_search.fit(X_train_flat, y_train_seq.ravel())
         svr_model = grid_search.best_estimator_
 
-        # Format gamma safely (it might be 'scale' or a float)
-        gamma_str = f"{svr_model.gamma:.3f}" if isinstance(
-            svr_model.gamma, (int, float)) else str(svr_model.gamma)
-        print(
-            f"   ✓ Best parameters: C={svr_model.C}, gamma={gamma_str}, epsilon={svr_model.epsilon:.3f}")
+        print(f"   ✓ Best parameters: {format_svr_params(svr_model)}")
+
+    if svr_cache_path and not svr_from_cache:
+        save_atomically(svr_cache_path, lambda tmp: joblib.dump(
+            svr_model, tmp, compress=3))
 
     y_train_pred = svr_model.predict(X_train_flat)
     y_test_pred = svr_model.predict(X_test_flat)
@@ -476,19 +736,28 @@ else:
         dropout_rate = 0.2
         use_two_layers = False
 
+    # ⚡ Mixed precision: on a GPU run the LSTM matmuls in float16 so they
+    # use the tensor cores. CPUs have no fast fp16 path, so stay in float32.
+    # lstm_units above are already multiples of 8 as tensor cores require.
+    if use_mixed_precision:
+        mixed_precision.set_global_policy('mixed_float16')
+        print("   ⚡ GPU detected: using mixed_float16 precision")
+
     model = Sequential()
 
+    # ⚠️ Keep the LSTM layers cuDNN-compatible (default tanh/sigmoid
+    # activations, unroll=False, no recurrent_dropout): any recurrent_dropout
+    # silently falls back to the generic kernel, which is several times
+    # slower on GPU. Regularize with input dropout=... or l2 instead.
     if use_two_layers:
         model.add(LSTM(lstm_units_1, return_sequences=True,
                   input_shape=input_shape))
-        #    dropout=0.1, recurrent_dropout=0.1
         model.add(LSTM(lstm_units_2))
-        # dropout=0.1, recurrent_dropout=0.1)
     else:
         model.add(LSTM(lstm_units, input_shape=input_shape))
-        #    dropout=0.1, recurrent_dropout=0.1
 
-    model.add(Dense(1))
+    # Keep the output layer in float32 so the loss is computed at full precision
+    model.add(Dense(1, dtype='float32'))
 
     # ⚡ OPTIMIZATIONS:
     # 1. Higher LR (0.002) for stability (0.005 was too jumpy)
@@ -514,80 +783,116 @@ else:
     # Upper bound on epochs; early stopping will usually stop earlier
     epochs = 80
     batch_size = max(32, len(X_train_seq) // 20)  # Larger batches for speed
+    batch_size = ((batch_size + 7) // 8) * 8  # multiple of 8 for tensor cores
 
     print(f"   Training: epochs={epochs}, batch_size={batch_size}")
 
-    history = model.fit(
-        X_train_seq, y_train_seq,
-        epochs=epochs,
-        batch_size=batch_size,
-        validation_split=0.15,
-        callbacks=[early_stop, reduce_lr],
-        verbose=1  # 🔊 Show progress bar for LSTM
-    )
-
-    print(f"   ✓ Training completed in {len(history.history['loss'])} epochs")
-
-    # Plot training history
-    plt.figure(figsize=(12, 4))
-    plt.subplot(1, 2, 1)
-    plt.plot(history.history['loss'], label='Training Loss')
-    plt.plot(history.history['val_loss'], label='Validation Loss')
-    plt.xlabel('Epoch')
-    plt.ylabel('Loss')
-    plt.title('Training Progress')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-
-    plt.subplot(1, 2, 2)
-    plt.plot(history.history['loss'], label='Training Loss (log scale)')
-    plt.plot(history.history['val_loss'], label='Validation Loss (log scale)')
-    plt.yscale('log')
-    plt.xlabel('Epoch')
-    plt.ylabel('Loss (log)')
-    plt.title('Training Progress (Log Scale)')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    # Save plot instead of showing (for server environments)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    plot_path = os.path.join(
-        script_dir, f'model_diagnosis_{model_type.lower()}.png')
-    plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-    print(f"📊 Model diagnosis plot saved to: {plot_path}")
-    plt.close()  # Close the figure to free memory
-
-    y_train_pred = model.predict(X_train_seq, verbose=0)
-    y_test_pred = model.predict(X_test_seq, verbose=0)
+    # ⚡ Feed Keras from a tf.data pipeline: tensors are converted once and
+    # cached, and the next batch is prepared while the current one trains.
+    # Validation takes the last 15% like validation_split=0.15 did.
+    val_split_idx = int(len(X_train_seq) * (1 - 0.15))
+    train_ds = (tf.data.Dataset.from_tensor_slices(
+        (X_train_seq[:val_split_idx], y_train_seq[:val_split_idx]))
+        .cache()
+        .shuffle(val_split_idx, reshuffle_each_iteration=True)
+        .batch(batch_size)
+        .prefetch(tf.data.AUTOTUNE))
+    val_ds = (tf.data.Dataset.from_tensor_slices(
+        (X_train_seq[val_split_idx:], y_train_seq[val_split_idx:]))
+        .batch(batch_size)
+        .cache()
+        .prefetch(tf.data.AUTOTUNE))
+
+    lstm_cache_path = model_cache_base and model_cache_base + '.keras'
+    history_cache_path = model_cache_base and model_cache_base + '.history.json'
+
+    history = None
+    if lstm_cache_path and os.path.exists(lstm_cache_path) \
+            and os.path.exists(history_cache_path):
+        try:
+            cached_model = load_model(lstm_cache_path)
+            with open(history_cache_path, 'r', encoding='utf-8') as f:
+                history = types.SimpleNamespace(history=json.load(f))
+            model = cached_model
+            print(f"   ⚡ Loaded cached LSTM model from: {lstm_cache_path}")
+        except Exception as e:
+            history = None
+            print(f"   ⚠️  Unreadable cached LSTM model, retraining: {e}")
+
+    if history is None:
+        history = model.fit(
+            train_ds,
+            epochs=epochs,
+            validation_data=val_ds,
+            callbacks=[early_stop, reduce_lr],
+            verbose=1  # 🔊 Show progress bar for LSTM
+        )
+        print(
+            f"   ✓ Training completed in {len(history.history['loss'])} epochs")
+
+        if lstm_cache_path:
+            def write_history(tmp):
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump({k: [float(v) for v in vals]
+                               for k, vals in history.history.items()}, f)
+            save_atomically(lstm_cache_path, model.save)
+            save_atomically(history_cache_path, write_history)
+
+    if GENERATE_PLOTS:
+        # Plot training history
+        plt.figure(figsize=(12, 4))
+        plt.subplot(1, 2, 1)
+        plt.plot(history.history['loss'], label='Training Loss')
+        plt.plot(history.history['val_loss'], label='Validation Loss')
+        plt.xlabel('Epoch')
+        plt.ylabel('Loss')
+        plt.title('Training Progress')
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+
+        plt.subplot(1, 2, 2)
+        plt.plot(history.history['loss'], label='Training Loss (log scale)')
+        plt.plot(history.history['val_loss'],
+                 label='Validation Loss (log scale)')
+        plt.yscale('log')
+        plt.xlabel('Epoch')
+        plt.ylabel('Loss (log)')
+        plt.title('Training Progress (Log Scale)')
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        # Save plot instead of showing (for server environments)
+        plot_path = os.path.join(
+            SCRIPT_DIR, f'model_diagnosis_{model_type.lower()}.png')
+        plt.savefig(plot_path, dpi=150, bbox_inches='tight')
+        print(f"📊 Model diagnosis plot saved to: {plot_path}")
+        plt.close()  # Close the figure to free memory
+
+    # ⚡ One predict pass over all windows (train followed by test, i.e.
+    # X_seq itself) with large batches, then split at the same index
+    all_pred = model.predict(X_seq, batch_size=256, verbose=0)
+    y_train_pred, y_test_pred = all_pred[:split_idx], all_pred[split_idx:]
     conf_val = np.std(y_test_seq - y_test_pred)
 
 # -----------------------------
 # 8️⃣ Inverse scale predictions
 # -----------------------------
-y_train_pred_inv = scaler_y.inverse_transform(
-    y_train_pred.reshape(-1, 1)).flatten()
-y_test_pred_inv = scaler_y.inverse_transform(
-    y_test_pred.reshape(-1, 1)).flatten()
-y_train_inv = scaler_y.inverse_transform(y_train_seq.reshape(-1, 1)).flatten()
-y_test_inv = scaler_y.inverse_transform(y_test_seq.reshape(-1, 1)).flatten()
+# The target scaler is a single-feature affine map, so undo it directly
+# (x * range + min) instead of reshaping to 2-D and flattening back
+y_data_min = scaler_y.data_min_[0]
+y_data_range = 1.0 / scaler_y.scale_[0]
+y_train_pred_inv = unscale(y_train_pred, y_data_min, y_data_range)
+y_test_pred_inv = unscale(y_test_pred, y_data_min, y_data_range)
+y_train_inv = unscale(y_train_seq, y_data_min, y_data_range)
+y_test_inv = unscale(y_test_seq, y_data_min, y_data_range)
 
 # -----------------------------
 # 9️⃣ Comprehensive metrics with underfitting detection
 # -----------------------------
-train_mae = mean_absolute_error(y_train_inv, y_train_pred_inv)
-train_rmse = np.sqrt(mean_squared_error(y_train_inv, y_train_pred_inv))
-test_mae = mean_absolute_error(y_test_inv, y_test_pred_inv)
-test_rmse = np.sqrt(mean_squared_error(y_test_inv, y_test_pred_inv))
-
-train_mape = np.mean(
-    np.abs((y_train_inv - y_train_pred_inv) / (y_train_inv + 1e-8))) * 100
-test_mape = np.mean(
-    np.abs((y_test_inv - y_test_pred_inv) / (y_test_inv + 1e-8))) * 100
-
-train_r2 = 1 - (np.sum((y_train_inv - y_train_pred_inv)**2) /
-                np.sum((y_train_inv - np.mean(y_train_inv))**2))
-test_r2 = 1 - (np.sum((y_test_inv - y_test_pred_inv)**2) /
-               np.sum((y_test_inv - np.mean(y_test_inv))**2))
+train_mae, train_rmse, train_mape, train_r2 = regression_metrics(
+    y_train_inv, y_train_pred_inv)
+test_mae, test_rmse, test_mape, test_r2 = regression_metrics(
+    y_test_inv, y_test_pred_inv)
 
 print("\n" + "="*70)
 print("📊 MODEL PERFORMANCE METRICS")
@@ -632,87 +937,106 @@ print("="*70 + "\n")
 # -----------------------------
 # 🔟 Plot predictions
 # -----------------------------
-fig, axes = plt.subplots(2, 1, figsize=(14, 8))
-
-axes[0].plot(y_train_inv, label="Actual", linewidth=2, alpha=0.7)
-axes[0].plot(y_train_pred_inv, label="Predicted", linewidth=2, alpha=0.7)
-axes[0].fill_between(range(len(y_train_inv)),
-                     y_train_pred_inv - train_rmse,
-                     y_train_pred_inv + train_rmse,
-                     alpha=0.2, label=f'±1 RMSE ({train_rmse:.2f})')
-axes[0].set_xlabel("Time Step")
-axes[0].set_ylabel(target_column)
-axes[0].set_title(
-    f"Training Set: Actual vs Predicted (MAE: {train_mae:.3f}, R²: {train_r2:.3f})")
-axes[0].legend()
-axes[0].grid(True, alpha=0.3)
-
-axes[1].plot(y_test_inv, label="Actual", linewidth=2, alpha=0.7)
-axes[1].plot(y_test_pred_inv, label="Predicted", linewidth=2, alpha=0.7)
-axes[1].fill_between(range(len(y_test_inv)),
-                     y_test_pred_inv - test_rmse,
-                     y_test_pred_inv + test_rmse,
-                     alpha=0.2, label=f'±1 RMSE ({test_rmse:.2f})')
-axes[1].set_xlabel("Time Step")
-axes[1].set_ylabel(target_column)
-axes[1].set_title(
-    f"Test Set: Actual vs Predicted (MAE: {test_mae:.3f}, R²: {test_r2:.3f})")
-axes[1].legend()
-axes[1].grid(True, alpha=0.3)
-
-plt.tight_layout()
-# Save plot instead of showing (for server environments)
-script_dir = os.path.dirname(os.path.abspath(__file__))
-plot_path = os.path.join(script_dir, 'training_predictions.png')
-plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-plt.close()  # Close the figure to free memory
+if GENERATE_PLOTS:
+    fig, axes = plt.subplots(2, 1, figsize=(14, 8))
+
+    axes[0].plot(y_train_inv, label="Actual", linewidth=2, alpha=0.7)
+    axes[0].plot(y_train_pred_inv, label="Predicted", linewidth=2, alpha=0.7)
+    axes[0].fill_between(range(len(y_train_inv)),
+                         y_train_pred_inv - train_rmse,
+                         y_train_pred_inv + train_rmse,
+                         alpha=0.2, label=f'±1 RMSE ({train_rmse:.2f})')
+    axes[0].set_xlabel("Time Step")
+    axes[0].set_ylabel(target_column)
+    axes[0].set_title(
+        f"Training Set: Actual vs Predicted (MAE: {train_mae:.3f}, R²: {train_r2:.3f})")
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].plot(y_test_inv, label="Actual", linewidth=2, alpha=0.7)
+    axes[1].plot(y_test_pred_inv, label="Predicted", linewidth=2, alpha=0.7)
+    axes[1].fill_between(range(len(y_test_inv)),
+                         y_test_pred_inv - test_rmse,
+                         y_test_pred_inv + test_rmse,
+                         alpha=0.2, label=f'±1 RMSE ({test_rmse:.2f})')
+    axes[1].set_xlabel("Time Step")
+    axes[1].set_ylabel(target_column)
+    axes[1].set_title(
+        f"Test Set: Actual vs Predicted (MAE: {test_mae:.3f}, R²: {test_r2:.3f})")
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    # Save plot instead of showing (for server environments)
+    plot_path = os.path.join(SCRIPT_DIR, 'training_predictions.png')
+    plt.savefig(plot_path, dpi=150, bbox_inches='tight')
+    plt.close()  # Close the figure to free memory
 
 # -----------------------------
 # 1️⃣1️⃣ Future predictions
 # -----------------------------
-last_seq = X_scaled[-SEQ_LEN:]
-future_preds_scaled = []
+# ⚡ Rolling window buffer, shifted in place each step instead of
+# reallocating it with np.vstack
+last_seq = X_scaled[-SEQ_LEN:].copy()
+future_preds_scaled = np.empty(FORECAST_WINDOW, dtype=np.float64)
 
 print(f"\n🔮 Generating {FORECAST_WINDOW} future forecasts...")
 
+if model_type == "SVR" and isinstance(svr_model, SVR):
+    # ⚡ Exact RBF SVR: evaluate the kernel row directly instead of going
+    # through svr_model.predict() validation on every step
+    svr_predict_step = make_rbf_svr_predictor(svr_model, X_train_flat)
+elif model_type == "SVR":
+    svr_predict_step = lambda x: svr_model.predict(x.reshape(1, -1))[0]
+else:
+    # ⚡ model.predict() sets up a data adapter and callbacks on every call,
+    # which dominates single-sample inference. Trace one step with a fixed
+    # input signature and call it directly instead. No jit_compile: on GPU
+    # the LSTM runs as a cuDNN op that XLA cannot compile.
+    @tf.function(
+        input_signature=[tf.TensorSpec(
+            (1, SEQ_LEN, X_scaled.shape[1]), tf.float32)])
+    def predict_step(x):
+        return model(x, training=False)
+
 for step in range(1, FORECAST_WINDOW + 1):
     # 1. Predict next step
     if model_type == "SVR":
-        pred_scaled = svr_model.predict(last_seq.reshape(1, -1))[0]
+        pred_scaled = svr_predict_step(last_seq)
     else:
-        pred_scaled = model.predict(last_seq.reshape(
-            1, SEQ_LEN, X_scaled.shape[1]), verbose=0)[0, 0]
+        pred_scaled = float(predict_step(
+            last_seq.reshape(1, SEQ_LEN, X_scaled.shape[1]))[0, 0])
 
-    future_preds_scaled.append(pred_scaled)
+    future_preds_scaled[step - 1] = pred_scaled
 
-    # 2. Create new row base (copy of last known state)
-    new_row_scaled = last_seq[-1, :].copy()
+    # 2. Slide window forward; the new last row starts as a copy of the
+    #    last known state
+    last_seq[:-1] = last_seq[1:]
 
     # 3. Inject the newly predicted target value into the feature
     #    vector when the target is part of X. This makes the
     #    multi-step forecast auto-regressive instead of simply
     #    repeating the last observed target.
     if target_in_X_index is not None:
-        new_row_scaled[target_in_X_index] = pred_scaled
+        last_seq[-1, target_in_X_index] = pred_scaled
 
-    # 4. Slide window forward with the new prediction context
-    last_seq = np.vstack([last_seq[1:], new_row_scaled])
-
-future_preds = scaler_y.inverse_transform(
-    np.array(future_preds_scaled).reshape(-1, 1)).flatten()
+future_preds = unscale(future_preds_scaled, y_data_min, y_data_range)
 
 # 🔧 FIX: Correctly scale the standard deviation (magnitude only, no offset)
-# We subtract the "zero point" to remove the data min_value offset
-zero_point = scaler_y.inverse_transform([[0]])[0, 0]
-conf_magnitude = scaler_y.inverse_transform([[conf_val]])[0, 0]
-conf_scaled = conf_magnitude - zero_point
+# A spread maps back through the scale alone, without the data_min offset
+conf_scaled = float(conf_val) * y_data_range
+# Interval bounds computed once as arrays and shared by the printout, the
+# JSON payload and the plot band
+future_lower = future_preds - conf_scaled
+future_upper = future_preds + conf_scaled
 
 print("\n" + "="*70)
 print("🔮 FUTURE PREDICTIONS WITH CONFIDENCE INTERVALS")
 print("="*70)
-for i, pred in enumerate(future_preds, 1):
+for i, (pred, lower, upper) in enumerate(
+        zip(future_preds, future_lower, future_upper), 1):
     print(
-        f"Step {i:2d}: {pred:7.2f} ± {conf_scaled:.2f}  (range: [{pred-conf_scaled:.2f}, {pred+conf_scaled:.2f}])")
+        f"Step {i:2d}: {pred:7.2f} ± {conf_scaled:.2f}  (range: [{lower:.2f}, {upper:.2f}])")
 print("="*70)
 
 # 📤 OUTPUT PREDICTIONS AS JSON
@@ -727,15 +1051,23 @@ def safe_float(value):
     return val
 
 
+def safe_float_list(values):
+    """Vectorized safe_float: one NaN/Inf pass, then plain Python floats"""
+    return np.nan_to_num(values, nan=0.0, posinf=0.0, neginf=0.0).tolist()
+
+
+confidence = safe_float(conf_scaled)
 predictions = [
     {
         "step": i,
-        "value": safe_float(pred),
-        "confidence": safe_float(conf_scaled),
-        "lowerBound": safe_float(pred - conf_scaled),
-        "upperBound": safe_float(pred + conf_scaled)
+        "value": pred,
+        "confidence": confidence,
+        "lowerBound": lower,
+        "upperBound": upper
     }
-    for i, pred in enumerate(future_preds, 1)
+    for i, (pred, lower, upper) in enumerate(
+        zip(safe_float_list(future_preds), safe_float_list(future_lower),
+            safe_float_list(future_upper)), 1)
 ]
 
 # Output JSON on a single line with a special marker so backend can parse it
@@ -762,68 +1094,73 @@ sys.stdout.write(json_output)
 sys.stdout.write("\n<FORECAST_JSON_END>\n")
 sys.stdout.flush()  # Ensure all output is written immediately
 
-# Plot future predictions
-plt.figure(figsize=(14, 5))
-# Show more history (last 50 points from test set)
-historical_tail = y_test_inv[-50:] if len(y_test_inv) >= 50 else y_test_inv
-# Get corresponding test predictions tail (same length as historical_tail)
-test_pred_tail = y_test_pred_inv[-len(historical_tail):] if len(
-    y_test_pred_inv) >= len(historical_tail) else y_test_pred_inv
-
-# Create continuous x-axis for entire plot
-n_hist = len(historical_tail)
-n_future = len(future_preds)
-x_all = np.arange(n_hist + n_future)
-
-# Concatenate historical with future for seamless connection
-# For actual values: historical + future (connect last historical to first future)
-actual_all = np.concatenate([historical_tail, future_preds])
-# For historical predictions: historical predictions + future (connect seamlessly)
-pred_all = np.concatenate([test_pred_tail, future_preds])
-
-# Plot historical actual values with markers
-plt.plot(x_all[:n_hist], historical_tail, 'o-', label='Historical Actual (Test)',
-         linewidth=2, color='blue', markersize=4)
-# Plot connecting line from last historical to future (actual values)
-plt.plot(x_all[n_hist-1:], actual_all[n_hist-1:], '-',
-         linewidth=2, color='blue', alpha=0.6)
-
-# Plot historical test predictions with markers
-plt.plot(x_all[:n_hist], test_pred_tail, 's-', label='Historical Predictions (Test)',
-         linewidth=2, color='green', markersize=4, alpha=0.7)
-# Plot connecting line from last historical prediction to future
-plt.plot(x_all[n_hist-1:], pred_all[n_hist-1:], '-',
-         linewidth=2, color='green', alpha=0.6)
-
-# Plot future predictions with markers (overlay on the connecting lines)
-plt.plot(x_all[n_hist:], future_preds, '^-', label='Future Predictions',
-         linewidth=2, color='orange', markersize=5)
-# Add confidence interval for future predictions
-plt.fill_between(x_all[n_hist:],
-                 future_preds - conf_scaled,
-                 future_preds + conf_scaled,
-                 alpha=0.3, color='orange', label='Confidence Interval')
-# Vertical line to mark where future predictions start
-plt.axvline(x=n_hist-0.5, color='red',
-            linestyle='--', label='Prediction Start', alpha=0.7)
-
-plt.xlabel('Time Step')
-plt.ylabel(target_column)
-# Update title to indicate only last 50 points are shown when applicable
-if len(y_test_inv) > 50:
-    plt.title(
-        f'Future Predictions ({FORECAST_WINDOW} steps ahead) - Showing Last 50 Historical Points')
-else:
-    plt.title(f'Future Predictions ({FORECAST_WINDOW} steps ahead)')
-plt.legend()
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-# Save plot instead of showing (for server environments)
-script_dir = os.path.dirname(os.path.abspath(__file__))
-plot_path = os.path.join(script_dir, 'forecast_plot.png')
-plt.savefig(plot_path, dpi=150, bbox_inches='tight')
-print(f"\n📊 Forecast plot saved to: {plot_path}")
-plt.close()  # Close the figure to free memory
+if FORECAST_PLOT:
+    # Plot future predictions
+    plt.figure(figsize=(14, 5))
+    # Show more history (last 50 points from test set); only these views are
+    # handed to matplotlib, the rest of the test set is never drawn
+    PLOT_HISTORY_POINTS = 50
+    historical_tail = y_test_inv[-PLOT_HISTORY_POINTS:]
+    n_hist = len(historical_tail)
+    # Get corresponding test predictions tail (same length as historical_tail)
+    test_pred_tail = y_test_pred_inv[-n_hist:]
+
+    # Create continuous x-axis for entire plot
+    n_future = len(future_preds)
+    x_all = np.arange(n_hist + n_future)
+
+    # Concatenate historical with future for seamless connection
+    # For actual values: historical + future (connect last historical to first future)
+    actual_all = np.concatenate([historical_tail, future_preds])
+    # For historical predictions: historical predictions + future (connect seamlessly)
+    pred_all = np.concatenate([test_pred_tail, future_preds])
+
+    # Plot historical actual values with markers
+    plt.plot(x_all[:n_hist], historical_tail, 'o-', label='Historical Actual (Test)',
+             linewidth=2, color='blue', markersize=4)
+    # Plot connecting line from last historical to future (actual values)
+    plt.plot(x_all[n_hist-1:], actual_all[n_hist-1:], '-',
+             linewidth=2, color='blue', alpha=0.6)
+
+    # Plot historical test predictions with markers
+    plt.plot(x_all[:n_hist], test_pred_tail, 's-', label='Historical Predictions (Test)',
+             linewidth=2, color='green', markersize=4, alpha=0.7)
+    # Plot connecting line from last historical prediction to future
+    plt.plot(x_all[n_hist-1:], pred_all[n_hist-1:], '-',
+             linewidth=2, color='green', alpha=0.6)
+
+    # Plot future predictions with markers (overlay on the connecting lines)
+    plt.plot(x_all[n_hist:], future_preds, '^-', label='Future Predictions',
+             linewidth=2, color='orange', markersize=5)
+    # Add confidence interval for future predictions
+    plt.fill_between(x_all[n_hist:],
+                     future_lower,
+                     future_upper,
+                     alpha=0.3, color='orange', label='Confidence Interval')
+    # Vertical line to mark where future predictions start
+    plt.axvline(x=n_hist-0.5, color='red',
+                linestyle='--', label='Prediction Start', alpha=0.7)
+
+    plt.xlabel('Time Step')
+    plt.ylabel(target_column)
+    # Update title to indicate only last 50 points are shown when applicable
+    if len(y_test_inv) > PLOT_HISTORY_POINTS:
+        plt.title(
+            f'Future Predictions ({FORECAST_WINDOW} steps ahead) - Showing Last {PLOT_HISTORY_POINTS} Historical Points')
+    else:
+        plt.title(f'Future Predictions ({FORECAST_WINDOW} steps ahead)')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    # Save plot instead of showing (for server environments)
+    plot_path = os.path.join(SCRIPT_DIR, 'forecast_plot.png')
+    # ⚡ PNG is lossless at every zlib level: the fastest one encodes quicker
+    # for a slightly larger file. The backend copies this file once and serves
+    # it, so resolution (dpi) and the tight bounding box are kept.
+    plt.savefig(plot_path, dpi=150, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1}, metadata={'Software': None})
+    print(f"\n📊 Forecast plot saved to: {plot_path}")
+    plt.close()  # Close the figure to free memory
 
 # -----------------------------
 # 📝 Final summary
@@ -844,11 +1181,7 @@ if model_type == "LSTM":
     print(f"Final Training Loss: {history.history['loss'][-1]:.6f}")
     print(f"Final Validation Loss: {history.history['val_loss'][-1]:.6f}")
 else:
-    # Format gamma safely (it might be 'scale' or a float)
-    gamma_str = f"{svr_model.gamma:.3f}" if isinstance(
-        svr_model.gamma, (int, float)) else str(svr_model.gamma)
-    print(
-        f"SVR Parameters: C={svr_model.C}, gamma={gamma_str}, epsilon={svr_model.epsilon:.3f}")
+    print(f"SVR Parameters: {format_svr_params(svr_model)}")
 print("="*70)
 print("\n💡 To use with a different dataset:")
 print("   1. Change: target_column, feature_columns")